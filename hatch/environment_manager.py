@@ -547,15 +547,18 @@ class HatchEnvironmentManager:
             
             if success:
                 # Update environment metadata with installed Hatch packages
-                for pkg_info in installed_packages:
-                    if pkg_info["type"] == "hatch":
-                        self._add_package_to_env_data(
-                            env_name=env_name,
-                            package_name=pkg_info["name"],
-                            package_version=pkg_info["version"],
-                            package_type=pkg_info["type"],
-                            source=pkg_info["source"]
-                        )
+                hatch_packages = [pkg_info for pkg_info in installed_packages if pkg_info["type"] == "hatch"]
+                for pkg_info in hatch_packages:
+                    self._add_package_to_env_data(
+                        env_name=env_name,
+                        package_name=pkg_info["name"],
+                        package_version=pkg_info["version"],
+                        package_type=pkg_info["type"],
+                        source=pkg_info["source"]
+                    )
+                # Persist all package entries with a single write
+                if hatch_packages:
+                    self._save_environments()
                 
                 self.logger.info(f"Successfully installed {len(installed_packages)} packages to environment {env_name}")
                 return True
@@ -570,7 +573,11 @@ class HatchEnvironmentManager:
     def _add_package_to_env_data(self, env_name: str, package_name: str, 
                                package_version: str, package_type: str, 
                                source: str) -> None:
-        """Update environment data with package information."""
+        """Update environment data with package information.
+
+        Only the in-memory environments are updated; the caller is responsible
+        for calling ``_save_environments`` once all packages are recorded.
+        """
         if env_name not in self._environments:
             raise HatchEnvironmentError(f"Environment {env_name} does not exist")
         
@@ -585,7 +592,6 @@ class HatchEnvironmentManager:
                     "source": source,
                     "installed_at": datetime.datetime.now().isoformat()
                 }
-                self._save_environments()
                 return
         
         # if it doesn't exist add new package entry
@@ -596,8 +602,6 @@ class HatchEnvironmentManager:
             "source": source,
             "installed_at": datetime.datetime.now().isoformat()
         }]
-
-        self._save_environments()
     
     def get_environment_path(self, env_name: str) -> Path:
         """
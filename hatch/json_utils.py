@@ -0,0 +1,48 @@
+"""JSON helpers using orjson when it is installed.
+
+orjson is an optional dependency (the ``perf`` extra). It parses and
+serializes large documents such as the registry much faster than the
+standard library; without it these helpers fall back to stdlib json.
+"""
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def json_loads(data: Union[bytes, str]) -> Any:
+    """Parse a JSON document.
+
+    Args:
+        data (Union[bytes, str]): Serialized JSON document.
+
+    Returns:
+        Any: The parsed document.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj: Any, pretty: bool = False) -> bytes:
+    """Serialize an object to UTF-8 JSON.
+
+    Non-ASCII characters are written as UTF-8 rather than escaped, with or
+    without orjson.
+
+    Args:
+        obj (Any): JSON-serializable object.
+        pretty (bool, optional): Indent the document by two spaces, for files meant to be
+            read and edited by hand. Defaults to False, which gives compact output.
+
+    Returns:
+        bytes: The serialized document.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else None)
+    if pretty:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+    return json.dumps(obj, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
@@ -44,6 +44,9 @@ class PythonEnvironmentManager:
         
         # Set up environment directories
         self.environments_dir = environments_dir or (Path.home() / ".hatch" / "envs")
+
+        # Cache of env_name -> python executable path resolved through conda
+        self._python_path_cache: Dict[str, Path] = {}
         
         # Detect available conda/mamba
         self.conda_executable = None
@@ -193,6 +196,9 @@ class PythonEnvironmentManager:
         if force and conda_env_exists:
             self.logger.info(f"Removing existing Python environment for {env_name}")
             self.remove_python_environment(env_name)
+
+        # The interpreter of the new environment is resolved again on next use
+        self._python_path_cache.pop(env_name, None)
         
         # Build conda create command
         cmd = [executable, "create", "--yes", "--name", env_name_conda]
@@ -308,11 +314,50 @@ class PythonEnvironmentManager:
         Returns:
             str: Path to Python executable if environment exists, None otherwise.
         """
-        if not self._conda_env_exists(env_name):
-            return None
-        
+        python_path = self._resolve_python_executable(env_name)
+        return str(python_path) if python_path is not None else None
+
+    def _cached_python_executable(self, env_name: str) -> Optional[Path]:
+        """Get the cached Python executable of an environment if it is still on disk.
+
+        Args:
+            env_name (str): Hatch environment name.
+
+        Returns:
+            Optional[Path]: The cached executable path, None if no path is cached or
+                the executable no longer exists.
+        """
+        python_path = self._python_path_cache.get(env_name)
+        if python_path is not None and python_path.is_file():
+            return python_path
+        return None
+
+    def _resolve_python_executable(self, env_name: str) -> Optional[Path]:
+        """Resolve the Python executable of an environment, reusing the last conda lookup.
+
+        Only the path resolved by conda is cached. The executable is checked with
+        is_file() on every call, so environments created or removed outside this
+        manager are seen right away. A cached path whose executable is gone is
+        resolved again.
+
+        Args:
+            env_name (str): Hatch environment name.
+
+        Returns:
+            Optional[Path]: Path to the Python executable, None if the environment is
+                unknown to conda or has no Python executable.
+        """
+        python_path = self._cached_python_executable(env_name)
+        if python_path is not None:
+            return python_path
+
         python_path = self._get_python_executable_path(env_name)
-        return str(python_path) if python_path and python_path.exists() else None
+        if python_path is None or not python_path.is_file():
+            self._python_path_cache.pop(env_name, None)
+            return None
+
+        self._python_path_cache[env_name] = python_path
+        return python_path
 
     def remove_python_environment(self, env_name: str) -> bool:
         """Remove a Python environment.
@@ -336,6 +381,8 @@ class PythonEnvironmentManager:
         executable = self.get_preferred_executable()
         env_name_conda = self._get_conda_env_name(env_name)
         
+        self._python_path_cache.pop(env_name, None)
+
         try:
             self.logger.info(f"Removing Python environment for {env_name}")
             
@@ -693,6 +740,9 @@ class PythonEnvironmentManager:
         Returns:
             bool: True if environment exists, False otherwise.
         """
+        # An environment whose interpreter was resolved before and is still on disk exists
+        if self._cached_python_executable(env_name) is not None:
+            return True
         return self._conda_env_exists(env_name)
     
     def get_environment_path(self, env_name: str) -> Optional[Path]:
@@ -704,6 +754,11 @@ class PythonEnvironmentManager:
         Returns:
             Path: Path to the conda environment directory, None if not found.
         """
+        python_path = self._cached_python_executable(env_name)
+        if python_path is not None:
+            # The interpreter is <env>/python.exe on Windows and <env>/bin/python elsewhere
+            return python_path.parent if platform.system() == "Windows" else python_path.parent.parent
+
         if not self.is_available():
             return None
         
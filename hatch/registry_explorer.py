@@ -3,47 +3,110 @@
 This module provides functions to search and extract information from
 a Hatch registry data structure (see hatch_all_pkg_metadata_schema.json).
 """
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Tuple
 from packaging.version import Version, InvalidVersion
 from packaging.specifiers import SpecifierSet, InvalidSpecifier
 
-def find_repository(registry: Dict[str, Any], repo_name: str) -> Optional[Dict[str, Any]]:
+
+class RegistryIndex:
+    """Name-based lookup tables built from a registry in a single traversal.
+
+    The index is a snapshot: its owner builds a new one whenever it replaces or
+    modifies the registry, and passes it to the lookup functions of this module
+    through their ``index`` argument.
+
+    Attributes:
+        repo_names (List[str]): Repository names in registry order, duplicates included.
+        repo_by_name (Dict[str, Dict[str, Any]]): Repository dicts keyed by repository name.
+        pkg_by_name_per_repo (Dict[str, Dict[str, Dict[str, Any]]]): For each repository name,
+            the package dicts of that repository keyed by package name.
+        global_pkg (Dict[str, Tuple[str, Dict[str, Any]]]): ``(repo_name, package dict)`` keyed
+            by package name. When several repositories provide the same package name, the first
+            one in registry order wins, as with a linear scan.
+        pkg_names_per_repo (Dict[str, List[str]]): For each repository name, the package names
+            of the repositories with that name in registry order, duplicates included.
+        pkg_names (List[str]): Package names of all repositories in registry order, duplicates included.
+    """
+
+    def __init__(self, registry: Dict[str, Any]):
+        """Build the index.
+
+        Args:
+            registry (Dict[str, Any]): The registry data.
+        """
+        self.repo_by_name: Dict[str, Dict[str, Any]] = {}
+        self.pkg_by_name_per_repo: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self.global_pkg: Dict[str, Tuple[str, Dict[str, Any]]] = {}
+        self.repo_names: List[str] = []
+        self.pkg_names_per_repo: Dict[str, List[str]] = {}
+        self.pkg_names: List[str] = []
+
+        for repo in registry.get("repositories", []):
+            repo_name = repo.get("name")
+            self.repo_names.append(repo_name)
+            self.repo_by_name.setdefault(repo_name, repo)
+            repo_pkgs = self.pkg_by_name_per_repo.setdefault(repo_name, {})
+            repo_pkg_names = self.pkg_names_per_repo.setdefault(repo_name, [])
+            for pkg in repo.get("packages", []):
+                pkg_name = pkg.get("name")
+                repo_pkgs.setdefault(pkg_name, pkg)
+                repo_pkg_names.append(pkg_name)
+                self.pkg_names.append(pkg_name)
+                self.global_pkg.setdefault(pkg_name, (repo_name, pkg))
+
+
+def find_repository(registry: Dict[str, Any], repo_name: str,
+                    index: Optional[RegistryIndex] = None) -> Optional[Dict[str, Any]]:
     """Find a repository by name.
     
     Args:
         registry (Dict[str, Any]): The registry data.
         repo_name (str): Name of the repository to find.
+        index (RegistryIndex, optional): Index of the registry, built once with RegistryIndex(registry)
+            and used instead of scanning the registry. Defaults to None.
         
     Returns:
         Optional[Dict[str, Any]]: Repository data if found, None otherwise.
     """
+    if index is not None:
+        return index.repo_by_name.get(repo_name)
     for repo in registry.get("repositories", []):
         if repo.get("name") == repo_name:
             return repo
     return None
 
-def list_repositories(registry: Dict[str, Any]) -> List[str]:
+def list_repositories(registry: Dict[str, Any], index: Optional[RegistryIndex] = None) -> List[str]:
     """List all repository names in the registry.
     
     Args:
         registry (Dict[str, Any]): The registry data.
+        index (RegistryIndex, optional): Index of the registry, built once with RegistryIndex(registry)
+            and used instead of scanning the registry. Defaults to None.
         
     Returns:
         List[str]: List of repository names.
     """
+    if index is not None:
+        return list(index.repo_names)
     return [repo.get("name") for repo in registry.get("repositories", [])]
 
-def find_package(registry: Dict[str, Any], package_name: str, repo_name: Optional[str] = None) -> Optional[Dict[str, Any]]:
+def find_package(registry: Dict[str, Any], package_name: str, repo_name: Optional[str] = None,
+                 index: Optional[RegistryIndex] = None) -> Optional[Dict[str, Any]]:
     """Find a package by name, optionally within a specific repository.
     
     Args:
         registry (Dict[str, Any]): The registry data.
         package_name (str): Name of the package to find.
         repo_name (str, optional): Name of the repository to search in. Defaults to None.
+        index (RegistryIndex, optional): Index of the registry, built once with RegistryIndex(registry)
+            and used instead of scanning the registry. Defaults to None.
         
     Returns:
         Optional[Dict[str, Any]]: Package data if found, None otherwise.
     """
+    if index is not None:
+        return _lookup_package(index, package_name, repo_name)
     repos = registry.get("repositories", [])
     if repo_name:
         repos = [r for r in repos if r.get("name") == repo_name]
@@ -53,16 +116,39 @@ def find_package(registry: Dict[str, Any], package_name: str, repo_name: Optiona
                 return pkg
     return None
 
-def list_packages(registry: Dict[str, Any], repo_name: Optional[str] = None) -> List[str]:
+def _lookup_package(index: RegistryIndex, package_name: str, repo_name: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    """Look up a package in a registry index.
+
+    Args:
+        index (RegistryIndex): Index of the registry to search.
+        package_name (str): Name of the package to find.
+        repo_name (str, optional): Name of the repository to search in. Defaults to None.
+
+    Returns:
+        Optional[Dict[str, Any]]: Package data if found, None otherwise.
+    """
+    if repo_name:
+        return index.pkg_by_name_per_repo.get(repo_name, {}).get(package_name)
+    entry = index.global_pkg.get(package_name)
+    return entry[1] if entry else None
+
+def list_packages(registry: Dict[str, Any], repo_name: Optional[str] = None,
+                  index: Optional[RegistryIndex] = None) -> List[str]:
     """List all package names, optionally within a specific repository.
     
     Args:
         registry (Dict[str, Any]): The registry data.
         repo_name (str, optional): Name of the repository to list packages from. Defaults to None.
+        index (RegistryIndex, optional): Index of the registry, built once with RegistryIndex(registry)
+            and used instead of scanning the registry. Defaults to None.
         
     Returns:
         List[str]: List of package names.
     """
+    if index is not None:
+        if repo_name:
+            return list(index.pkg_names_per_repo.get(repo_name, []))
+        return list(index.pkg_names)
     packages = []
     repos = registry.get("repositories", [])
     if repo_name:
@@ -83,11 +169,117 @@ def get_latest_version(pkg: Dict[str, Any]) -> Optional[str]:
     """
     return pkg.get("latest_version")
 
+@lru_cache(maxsize=4096)
+def _parse_version(version: str) -> Version:
+    """Parse a version string, memoized.
+
+    Args:
+        version (str): Version string to parse.
+
+    Returns:
+        Version: The parsed version.
+
+    Raises:
+        InvalidVersion: If the version string cannot be parsed.
+    """
+    return Version(version)
+
+@lru_cache(maxsize=1024)
+def _parse_spec(constraint: str) -> SpecifierSet:
+    """Parse a normalized constraint string into a specifier set, memoized.
+
+    Args:
+        constraint (str): Constraint string with an explicit operator.
+
+    Returns:
+        SpecifierSet: The parsed specifier set.
+
+    Raises:
+        InvalidSpecifier: If the constraint cannot be parsed.
+    """
+    return SpecifierSet(constraint)
+
+# First characters of every PEP 440 comparison operator (==, !=, <=, >=, <, >, ~=, ===)
+_CONSTRAINT_OP_CHARS = "<>=!~"
+
+def _normalize_constraint(constraint: str) -> str:
+    """Turn a bare version constraint such as "1.0.0" into "==1.0.0".
+
+    Args:
+        constraint (str): Version constraint.
+
+    Returns:
+        str: The constraint with an explicit operator.
+    """
+    if constraint and constraint[0] not in _CONSTRAINT_OP_CHARS:
+        return f"=={constraint}"
+    return constraint
+
+def _exact_version(constraint: str) -> Optional[Version]:
+    """Get the target version of a plain equality constraint.
+
+    Args:
+        constraint (str): Normalized version constraint (e.g., '==1.2.3').
+
+    Returns:
+        Optional[Version]: The version required by a single, non-wildcard '=='
+            constraint, None for any other kind of constraint.
+    """
+    if not constraint.startswith("==") or constraint.startswith("==="):
+        return None
+    target = constraint[2:].strip()
+    if not target or any(c in target for c in ",<>!=~*"):
+        return None
+    try:
+        return _parse_version(target)
+    except InvalidVersion:
+        return None
+
+def _equals_exact(version: Version, target: Version) -> bool:
+    """Check a version against the target of a plain equality constraint.
+
+    A local version label on the candidate is ignored when the target has none,
+    as PEP 440 requires.
+
+    Args:
+        version (Version): Candidate version.
+        target (Version): Version required by the constraint.
+
+    Returns:
+        bool: True if the version satisfies '==target'.
+    """
+    if target.local is None and version.local is not None:
+        return _parse_version(version.public) == target
+    return version == target
+
+def _matches(version: Version, constraint: str) -> bool:
+    """Check a parsed version against a normalized constraint.
+
+    Plain equality constraints are compared directly, without a SpecifierSet;
+    any other constraint goes through the memoized SpecifierSet.
+
+    Args:
+        version (Version): Candidate version.
+        constraint (str): Constraint string with an explicit operator.
+
+    Returns:
+        bool: True if the version satisfies the constraint.
+
+    Raises:
+        InvalidSpecifier: If the constraint cannot be parsed.
+    """
+    target = _exact_version(constraint)
+    if target is not None:
+        return _equals_exact(version, target)
+    return version in _parse_spec(constraint)
+
 def _match_version_constraint(version: str, constraint: str) -> bool:
     """Check if a version string matches a constraint.
     
     Uses the 'packaging' library for robust version comparison.
     If a simple version like "1.0.0" is passed as constraint, it's treated as "==1.0.0".
+    Parsed versions and constraints are memoized across calls. A version or
+    constraint that cannot be parsed only matches when both strings are equal.
     
     Args:
         version (str): Version string to check.
@@ -97,17 +289,8 @@ def _match_version_constraint(version: str, constraint: str) -> bool:
         bool: True if version matches constraint, False otherwise.
     """
     try:
-        v = Version(version)
-        
-        # Convert the constraint to a proper SpecifierSet if it doesn't have an operator
-        if constraint and not any(constraint.startswith(op) for op in ['==', '!=', '<=', '>=', '<', '>']):
-            constraint = f"=={constraint}"
-            
-        # Accept constraints like '==1.2.3', '>=1.0.0', etc.
-        spec = SpecifierSet(constraint)
-        return v in spec
+        return _matches(_parse_version(version), _normalize_constraint(constraint))
     except (InvalidVersion, InvalidSpecifier):
-        # If we can't parse versions, fall back to string comparison
         return version == constraint
 
 def find_package_version(pkg: Dict[str, Any], version_constraint: Optional[str] = None) -> Optional[Dict[str, Any]]:
@@ -116,7 +299,7 @@ def find_package_version(pkg: Dict[str, Any], version_constraint: Optional[str]
     This function uses a multi-step approach to find the appropriate version:
     1. If no constraint is given, it returns the latest version
     2. If that's not found, it falls back to the highest version number
-    3. For specific constraints, it sorts versions and checks compatibility
+    3. For specific constraints, it returns the highest compatible version
     
     Args:
         pkg (Dict[str, Any]): The package dictionary.
@@ -125,6 +308,20 @@ def find_package_version(pkg: Dict[str, Any], version_constraint: Optional[str]
     Returns:
         Optional[Dict[str, Any]]: The version dict matching the constraint or latest version.
     """
+    return _select_version(pkg, version_constraint)
+
+def _select_version(pkg: Dict[str, Any], version_constraint: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    """Select the version dict of a package for a constraint.
+
+    See find_package_version() for the selection rules.
+
+    Args:
+        pkg (Dict[str, Any]): The package dictionary.
+        version_constraint (str, optional): A version constraint string. Defaults to None.
+
+    Returns:
+        Optional[Dict[str, Any]]: The selected version dict, or None if none matches.
+    """
     versions = pkg.get("versions", [])
     if not versions:
         return None
@@ -136,19 +333,36 @@ def find_package_version(pkg: Dict[str, Any], version_constraint: Optional[str]
                 return v
         # fallback: return the highest version
         try:
-            return max(versions, key=lambda x: Version(x.get("version", "0")))
+            return max(versions, key=lambda x: _parse_version(x.get("version", "0")))
         except Exception:
-            return versions[-1]    # Try to find a version matching the constraint
-    try:
-        sorted_versions = sorted(versions, key=lambda x: Version(x.get("version", "0")), reverse=True)
-    except Exception:
-         sorted_versions = versions
-    
-    # If no exact match, try parsing as a constraint
-    for v in sorted_versions:
-        if _match_version_constraint(v.get("version", ""), version_constraint):
-            return v
-    return None
+            return versions[-1]
+
+    # Matching follows _match_version_constraint()
+    constraint = _normalize_constraint(version_constraint)
+
+    # Keep the highest matching version in a single pass, without sorting.
+    # A matching version that cannot be parsed is only used if nothing else matches.
+    best = None
+    best_key = None
+    unparsed_match = None
+    for v in versions:
+        vs = v.get("version", "")
+        try:
+            key = _parse_version(vs)
+        except InvalidVersion:
+            if unparsed_match is None and vs == version_constraint:
+                unparsed_match = v
+            continue
+        try:
+            matched = _matches(key, constraint)
+        except InvalidSpecifier:
+            # Unparsable constraints only match versions spelled exactly as the constraint
+            matched = vs == version_constraint
+        if not matched:
+            continue
+        if best_key is None or key > best_key:
+            best, best_key = v, key
+    return best if best is not None else unparsed_match
 
 def get_package_release_url(pkg: Dict[str, Any], version_constraint: Optional[str] = None) -> Tuple[Optional[str], Optional[str]]:
     """Get the release URI for a package version matching the constraint (or latest).
@@ -165,7 +379,7 @@ def get_package_release_url(pkg: Dict[str, Any], version_constraint: Optional[st
     if pkg is None:
         return None, None
 
-    vdict = find_package_version(pkg, version_constraint)
+    vdict = _select_version(pkg, version_constraint)
     if vdict:
         return vdict.get("release_uri"), vdict.get("version")
     return None, None
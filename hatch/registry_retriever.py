@@ -5,16 +5,53 @@ supporting both online and simulation modes with caching at file system and in-m
 """
 
 import os
+import gzip
 import json
 import logging
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import hashlib
 import time
 import datetime
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, Any, Optional, Tuple, Union
 from urllib.parse import urlparse
 
+from hatch.json_utils import json_loads
+
+_GZIP_MAGIC = b"\x1f\x8b"
+
+# (connect, read) timeouts in seconds for registry requests: connecting fails fast
+# when offline, while the download of a large registry is given more time
+_REQUEST_TIMEOUT = (5, 30)
+
+
+def _decode_registry_bytes(data: bytes) -> Any:
+    """Parse a registry file's content, gzip-compressed or not.
+
+    Args:
+        data (bytes): Raw file content.
+
+    Returns:
+        Any: The parsed registry.
+    """
+    if data[:2] == _GZIP_MAGIC:
+        data = gzip.decompress(data)
+    return json_loads(data)
+
+def _load_registry_file(path: Path) -> Any:
+    """Parse a registry file, gzip-compressed or not.
+
+    Args:
+        path (Path): Path of the registry file.
+
+    Returns:
+        Any: The parsed registry.
+    """
+    return _decode_registry_bytes(path.read_bytes())
+
 class RegistryRetriever:
     """Manages the retrieval and caching of the Hatch package registry.
     
@@ -57,7 +94,7 @@ class RegistryRetriever:
                 
             # Use file:// URL format for local files
             self.registry_url = f"file://{str(self.registry_cache_path.absolute())}"
-            self.logger.info(f"Operating in simulation mode with registry at: {self.registry_cache_path}")
+            self.logger.info("Operating in simulation mode with registry at: %s", self.registry_cache_path)
         else:
             # Online mode - set today's date as the default target
             self.today_date = datetime.datetime.now(datetime.timezone.utc).date()
@@ -65,21 +102,59 @@ class RegistryRetriever:
             
             # We'll set the initial URL to today, but might fall back to yesterday
             self.registry_url = f"https://github.com/CrackingShells/Hatch-Registry/releases/download/{self.today_str}/hatch_packages_registry.json"
-            self.logger.info(f"Operating in online mode with registry at: {self.registry_url}")
+            self.logger.info("Operating in online mode with registry at: %s", self.registry_url)
         
-            # Generate cache filename - same regardless of which day's registry we end up using
-            self.registry_cache_path = self.cache_dir / "registry" / "hatch_packages_registry.json"
+            # Generate cache filename - same regardless of which day's registry we end up using.
+            # The registry is highly compressible, so the online cache is stored gzip-compressed.
+            self.registry_cache_path = self.cache_dir / "registry" / "hatch_packages_registry.json.gz"
+
+        # Ensure registry cache directory exists
+        self.registry_cache_path.parent.mkdir(parents=True, exist_ok=True)
         
+        # HTTP session reused across requests to keep connections to GitHub alive
+        self._session = requests.Session()
+        # requests decompresses gzip-encoded bodies transparently
+        self._session.headers["Accept-Encoding"] = "gzip, deflate"
+        # Transient 5xx answers are retried, but a failed connection only once,
+        # so that an offline machine gives up quickly
+        self._session.mount("https://", HTTPAdapter(
+            max_retries=Retry(total=2, connect=1, backoff_factor=0.3, status_forcelist=[500, 502, 503, 504])
+        ))
+
         # In-memory cache
         self._registry_cache = None
+        # Wall-clock time of the last fetch, persisted and used for the daily freshness check
         self._last_fetch_time = 0
+        # Monotonic time at which the in-memory cache was last refreshed, used for its TTL
+        self._last_fetch_monotonic: Optional[float] = None
+        # (mtime_ns, size) of the cache file the in-memory registry corresponds to
+        self._cache_stat_key = None
         
         # Set up persistent timestamp file path
         self._last_fetch_time_path = self.cache_dir / "registry" / ".last_fetch_time"
+
+        # Sidecar file storing the HTTP validators (ETag / Last-Modified) of the cached registry
+        self._registry_meta_path = self.cache_dir / "registry" / "registry.meta.json"
         
         # Load persistent timestamp on initialization
         self._load_last_fetch_time()
     
+    def close(self) -> None:
+        """Close the HTTP session and release its pooled connections."""
+        self._session.close()
+
+    def __enter__(self) -> "RegistryRetriever":
+        """Enter a context in which the retriever's HTTP session is open.
+
+        Returns:
+            RegistryRetriever: This retriever.
+        """
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """Close the HTTP session when leaving the context."""
+        self.close()
+    
     def _load_last_fetch_time(self) -> None:
         """Load the last fetch timestamp from persistent storage.
         
@@ -91,14 +166,14 @@ class RegistryRetriever:
             if self._last_fetch_time_path.exists():
                 with open(self._last_fetch_time_path, 'r', encoding='utf-8') as f:
                     timestamp_str = f.read().strip()
-                    # Parse ISO8601 timestamp
-                    timestamp_dt = datetime.datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
+                    # Parse ISO8601 timestamp (fromisoformat accepts the 'Z' suffix since Python 3.11)
+                    timestamp_dt = datetime.datetime.fromisoformat(timestamp_str)
                     self._last_fetch_time = timestamp_dt.timestamp()
-                    self.logger.debug(f"Loaded last fetch time from disk: {timestamp_str}")
+                    self.logger.debug("Loaded last fetch time from disk: %s", timestamp_str)
             else:
                 self.logger.debug("No persistent timestamp file found, treating cache as outdated")
         except Exception as e:
-            self.logger.warning(f"Failed to read persistent timestamp: {e}, treating cache as outdated")
+            self.logger.warning("Failed to read persistent timestamp: %s, treating cache as outdated", e)
             self._last_fetch_time = 0
     
     def _save_last_fetch_time(self) -> None:
@@ -118,9 +193,9 @@ class RegistryRetriever:
             with open(self._last_fetch_time_path, 'w', encoding='utf-8') as f:
                 f.write(timestamp_str)
             
-            self.logger.debug(f"Saved last fetch time to disk: {timestamp_str}")
+            self.logger.debug("Saved last fetch time to disk: %s", timestamp_str)
         except Exception as e:
-            self.logger.warning(f"Failed to save persistent timestamp: {e}")
+            self.logger.warning("Failed to save persistent timestamp: %s", e)
     
     def _read_local_cache(self) -> Dict[str, Any]:
         """Read the registry from local cache file.
@@ -132,29 +207,218 @@ class RegistryRetriever:
             Exception: If reading the cache file fails.
         """
         try:
-            with open(self.registry_cache_path, 'r') as f:
-                return json.load(f)
+            return _load_registry_file(self.registry_cache_path)
         except Exception as e:
-            self.logger.error(f"Failed to read local registry file: {e}")
+            self.logger.error("Failed to read local registry file: %s", e)
             raise e
     
-    def _write_local_cache(self, registry_data: Dict[str, Any]) -> None:
-        """Write the registry data to local cache file.
+    def _write_local_cache_bytes(self, content: bytes) -> bool:
+        """Write an already serialized registry to local cache file.
+
+        The content is gzip-compressed when the cache file has a ``.gz`` suffix.
         
         Args:
-            registry_data (Dict[str, Any]): Registry data to cache.
+            content (bytes): Serialized registry JSON document.
+
+        Returns:
+            bool: True if the cache file was written, False otherwise.
         """
         try:
-            with open(self.registry_cache_path, 'w') as f:
-                json.dump(registry_data, f, indent=2)
+            if self.registry_cache_path.suffix == ".gz":
+                content = gzip.compress(content, compresslevel=6)
+            self._atomic_write_bytes(self.registry_cache_path, content)
+            return True
         except Exception as e:
-            self.logger.error(f"Failed to write local cache: {e}")
+            self.logger.error("Failed to write local cache: %s", e)
+            return False
+
+    def _atomic_write_bytes(self, path: Path, content: bytes) -> None:
+        """Write a file atomically.
+
+        The content is written to a sibling temporary file which is then moved
+        over the target with ``os.replace``, so that readers (including other
+        Hatch processes) never observe a truncated or partially written file.
+
+        Args:
+            path (Path): File to write.
+            content (bytes): Content of the file.
+
+        Raises:
+            OSError: If writing or replacing the file fails.
+        """
+        # The directory may have been removed since __init__ created it
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.tmp.{os.getpid()}")
+        try:
+            tmp_path.write_bytes(content)
+            os.replace(tmp_path, path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+    def _registry_url_for(self, date_str: str) -> str:
+        """Build the URL of the registry asset released on the given date.
+
+        Args:
+            date_str (str): Date string in YYYY-MM-DD format.
+
+        Returns:
+            str: URL of the registry JSON asset.
+        """
+        return f"https://github.com/CrackingShells/Hatch-Registry/releases/download/{date_str}/hatch_packages_registry.json"
+
+    def _load_registry_meta(self) -> Dict[str, Any]:
+        """Load the HTTP validators stored alongside the cached registry.
+
+        Returns:
+            Dict[str, Any]: Stored ``url``, ``etag`` and ``last_modified`` values,
+                empty if the sidecar file is missing or unreadable.
+        """
+        try:
+            with open(self._registry_meta_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            self.logger.warning("Failed to read registry metadata: %s, ignoring it", e)
+            return {}
+
+    def _save_registry_meta(self, url: str, response: requests.Response) -> None:
+        """Store the HTTP validators of a fetched registry alongside the cache.
+
+        Args:
+            url (str): URL the registry was fetched from.
+            response (requests.Response): Response carrying the registry.
+        """
+        meta = {
+            "url": url,
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified")
+        }
+        try:
+            self._atomic_write_bytes(self._registry_meta_path, json.dumps(meta).encode('utf-8'))
+        except Exception as e:
+            self.logger.warning("Failed to save registry metadata: %s", e)
+
+    def _conditional_headers(self, url: str) -> Dict[str, str]:
+        """Build conditional request headers for a registry URL.
+
+        Validators are only sent when they were recorded for the same URL and
+        the cached registry they describe is still on disk.
+
+        Args:
+            url (str): URL about to be fetched.
+
+        Returns:
+            Dict[str, str]: ``If-None-Match`` / ``If-Modified-Since`` headers, possibly empty.
+        """
+        if not self.registry_cache_path.exists():
+            return {}
+
+        meta = self._load_registry_meta()
+        if meta.get("url") != url:
+            return {}
+
+        headers = {}
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+        return headers
+
+    def _request_registry(self, url: str, conditional: bool = True) -> requests.Response:
+        """Send a streamed GET request for a registry asset.
+
+        Args:
+            url (str): URL of the registry asset.
+            conditional (bool, optional): Whether to send the validators of the cached
+                registry so that the server can answer ``304 Not Modified``. Defaults to True.
+
+        Returns:
+            requests.Response: The response, whose body has not been downloaded yet.
+        """
+        self.logger.info("Fetching registry from %s", url)
+        headers = self._conditional_headers(url) if conditional else {}
+        return self._session.get(url, headers=headers, timeout=_REQUEST_TIMEOUT, stream=True)
+
+    def _store_registry_response(self, url: str, response: requests.Response) -> Dict[str, Any]:
+        """Parse a downloaded registry and write it to the local cache.
+
+        Args:
+            url (str): URL the registry was fetched from.
+            response (requests.Response): Response carrying the registry.
+
+        Returns:
+            Dict[str, Any]: Registry data.
+
+        Raises:
+            requests.HTTPError: If the response carries an error status.
+        """
+        response.raise_for_status()
+        # Parse the body once and store it on disk as received, without re-serializing
+        content = response.content
+        registry_data = json_loads(content)
+        # Only record validators describing a cache file that was actually written
+        if self._write_local_cache_bytes(content):
+            self._save_registry_meta(url, response)
+        return registry_data
+
+    def _read_registry_response(self, url: str, response: requests.Response) -> Dict[str, Any]:
+        """Get the registry data answered by a conditional registry request.
+
+        A ``304 Not Modified`` answer reuses the local cache file. If that file
+        turns out to be unreadable, the registry is downloaded again without
+        validators; that second response is closed here, while the given one
+        stays owned by the caller.
+
+        Args:
+            url (str): URL of the registry asset.
+            response (requests.Response): Response to the conditional request.
+
+        Returns:
+            Dict[str, Any]: Registry data.
+
+        Raises:
+            Exception: If the registry cannot be downloaded or parsed.
+        """
+        if response.status_code != 304:
+            return self._store_registry_response(url, response)
+
+        self.logger.debug("Registry not modified since last fetch, reusing local cache")
+        file_key = self._cache_file_key()
+        if self._registry_cache is not None and file_key is not None and file_key == self._cache_stat_key:
+            # The in-memory registry still reflects the cache file, so it is not parsed again
+            registry_data = self._registry_cache
+        else:
+            try:
+                registry_data = self._read_local_cache()
+            except Exception as e:
+                # The validators describe a cache that is no longer usable: drop them and download again
+                self.logger.warning("Cached registry is unreadable (%s), downloading it again", e)
+                self._registry_meta_path.unlink(missing_ok=True)
+                fresh = self._request_registry(url, conditional=False)
+                try:
+                    return self._store_registry_response(url, fresh)
+                finally:
+                    fresh.close()
+
+        # Bump the cache file mtime to record the successful revalidation. The stat key
+        # follows the touch, so that the unchanged file is not taken for a new one.
+        os.utime(self.registry_cache_path)
+        self._cache_stat_key = self._cache_file_key()
+        return registry_data
 
     def _fetch_remote_registry(self) -> Dict[str, Any]:
         """Fetch registry data from remote URL with fallback to previous day.
         
-        Attempts to fetch today's registry first, falling back to previous day if necessary.
-        Updates the is_delayed flag based on which registry was successfully retrieved.
+        Issues conditional GETs for today's and yesterday's registry assets in
+        parallel and uses today's, falling back to the previous day's asset if
+        today's is not published yet or cannot be fetched. Updates the is_delayed
+        flag based on which registry was successfully retrieved.
+
+        In online mode the local cache and its HTTP validators are updated here:
+        a ``304 Not Modified`` answer reuses the local cache file without any body
+        transfer, while a ``200`` answer replaces it.
         
         Returns:
             Dict[str, Any]: Registry data from remote source.
@@ -164,63 +428,58 @@ class RegistryRetriever:
         """
         if self.simulation_mode:
             try:
-                self.logger.info(f"Fetching registry from {self.registry_url}")
-                with open(self.registry_cache_path, 'r') as f:
-                    return json.load(f)
+                self.logger.info("Fetching registry from %s", self.registry_url)
+                return _load_registry_file(self.registry_cache_path)
             except Exception as e:
-                self.logger.error(f"Failed to fetch registry in simulation mode: {e}")
+                self.logger.error("Failed to fetch registry in simulation mode: %s", e)
                 raise e
         
-        # Online mode - try today's registry first
-        date = self.today_date.strftime('%Y-%m-%d')
-        if self._registry_exists(date):
-            self.registry_url = f"https://github.com/CrackingShells/Hatch-Registry/releases/download/{date}/hatch_packages_registry.json"
-            self.is_delayed = False  # Reset delayed flag for today's registry
-        else:
-            self.logger.info(f"Today's registry ({date}) not found, falling back to yesterday's")
-            # Fall back to yesterday's registry
-            yesterday = self.today_date - datetime.timedelta(days=1)
-            date = yesterday.strftime('%Y-%m-%d')
-
-            if not self._registry_exists(date):
-                self.logger.error(f"Yesterday's registry ({date}) also not found, cannot proceed")
-                raise Exception("No valid registry found for today or yesterday")
-            
-            # Use yesterday's registry URL
-            self.registry_url = f"https://github.com/CrackingShells/Hatch-Registry/releases/download/{date}/hatch_packages_registry.json"
-            self.is_delayed = True  # Set delayed flag for yesterday's registry
+        # Online mode - prefer today's registry, fall back to yesterday's
+        yesterday = self.today_date - datetime.timedelta(days=1)
+        candidates = [
+            (self.today_date.strftime('%Y-%m-%d'), False),
+            (yesterday.strftime('%Y-%m-%d'), True)
+        ]
 
-        try:
-            self.logger.info(f"Fetching registry from {self.registry_url}")
-            response = requests.get(self.registry_url, timeout=30)
-            response.raise_for_status()
-            return response.json()
-        
-        except Exception as e:
-            self.logger.error(f"Failed to fetch registry from {self.registry_url}: {e}")
-            raise e
-    
-    def _registry_exists(self, date_str: str) -> bool:
-        """Check if registry for the given date exists.
-        
-        Makes a HEAD request to check if the release page for the given date exists.
-        
-        Args:
-            date_str (str): Date string in YYYY-MM-DD format.
-            
-        Returns:
-            bool: True if registry exists, False otherwise.
-        """
-        if self.simulation_mode:
-            return self.registry_cache_path.exists()
-        
+        # Send both requests concurrently so that falling back to yesterday's registry does not
+        # cost a second round-trip. Bodies are streamed, so only the selected one is downloaded.
+        with ThreadPoolExecutor(max_workers=len(candidates)) as executor:
+            futures = [
+                executor.submit(self._request_registry, self._registry_url_for(date))
+                for date, _ in candidates
+            ]
 
-        url = f"https://github.com/CrackingShells/Hatch-Registry/releases/tag/{date_str}"
         try:
-            response = requests.head(url, timeout=10)
-            return response.status_code == 200
-        except Exception:
-            return False
+            for (date, is_delayed), future in zip(candidates, futures):
+                url = self._registry_url_for(date)
+                try:
+                    response = future.result()
+
+                    if response.status_code == 404:
+                        if not is_delayed:
+                            self.logger.info("Today's registry (%s) not found, falling back to yesterday's", date)
+                        continue
+
+                    registry_data = self._read_registry_response(url, response)
+                except Exception as e:
+                    # Any failure of today's registry is treated like a missing registry
+                    if not is_delayed:
+                        self.logger.warning("Failed to fetch registry from %s: %s, trying the previous day's", url, e)
+                        continue
+                    self.logger.error("Failed to fetch registry from %s: %s", url, e)
+                    raise e
+
+                self.registry_url = url
+                self.is_delayed = is_delayed  # Set when falling back to yesterday's registry
+                return registry_data
+        finally:
+            # Release the connections of both streamed responses, used or not
+            for future in futures:
+                if future.exception() is None:
+                    future.result().close()
+
+        self.logger.error("Yesterday's registry (%s) also not found, cannot proceed", candidates[-1][0])
+        raise Exception("No valid registry found for today or yesterday")
     
     def get_registry(self, force_refresh: bool = False) -> Dict[str, Any]:
         """Fetch the registry file.
@@ -241,49 +500,57 @@ class RegistryRetriever:
         Raises:
             Exception: If fetching the registry fails.
         """
-        current_time = datetime.datetime.now(datetime.timezone.utc).timestamp()
+        now = time.monotonic()
         
         # Check if in-memory cache is valid
         if (not force_refresh and 
             self._registry_cache is not None and 
-            current_time - self._last_fetch_time < self.cache_ttl):
+            self._last_fetch_monotonic is not None and
+            now - self._last_fetch_monotonic < self.cache_ttl):
             self.logger.debug("Using in-memory cache")
             return self._registry_cache
         
-        # Ensure registry cache directory exists
-        self.registry_cache_path.parent.mkdir(parents=True, exist_ok=True)
+        current_time = time.time()
             
         # Check if local cache is not outdated
         if not force_refresh and not self.is_cache_outdated():
             try:
+                # Skip parsing when the in-memory registry already reflects the file on disk
+                file_key = self._cache_file_key()
+                if self._registry_cache is not None and file_key is not None and file_key == self._cache_stat_key:
+                    self.logger.debug("Local cache file unchanged, using in-memory cache")
+                    self._last_fetch_time = current_time
+                    self._last_fetch_monotonic = now
+                    return self._registry_cache
+
                 self.logger.debug("Using local cache file")
                 registry_data = self._read_local_cache()
                 # Update in-memory cache
                 self._registry_cache = registry_data
+                self._cache_stat_key = file_key
                 self._last_fetch_time = current_time
+                self._last_fetch_monotonic = now
                 
                 return registry_data
             except Exception as e:
-                self.logger.warning(f"Error reading local cache: {e}, will fetch from source instead")
+                self.logger.warning("Error reading local cache: %s, will fetch from source instead", e)
                 # If reading cache fails, continue to fetch from source
             
         # Fetch from source based on mode
         try:
             if self.simulation_mode:
-                # In simulation mode, we must have a local registry file
+                # In simulation mode, we must have a local registry file.
+                # It is also the cache file, so there is nothing to write back.
                 registry_data = self._read_local_cache()
             else:
-                # In online mode, fetch from remote URL
+                # In online mode, fetch from remote URL (this also updates the local cache)
                 registry_data = self._fetch_remote_registry()
             
-            # Update local cache
-            # Note that in case of simulation mode AND default cache path,
-            # we are rewriting the same file with the same content
-            self._write_local_cache(registry_data)
-            
             # Update in-memory cache
             self._registry_cache = registry_data
+            self._cache_stat_key = self._cache_file_key()
             self._last_fetch_time = current_time
+            self._last_fetch_monotonic = now
             
             # Update persistent timestamp
             self._save_last_fetch_time()
@@ -291,9 +558,21 @@ class RegistryRetriever:
             return registry_data
             
         except Exception as e:
-            self.logger.error(f"Failed to fetch registry: {e}")
+            self.logger.error("Failed to fetch registry: %s", e)
             raise e
     
+    def _cache_file_key(self) -> Optional[Tuple[int, int]]:
+        """Get a cheap change-detection key for the local cache file.
+
+        Returns:
+            Optional[Tuple[int, int]]: The file's ``(st_mtime_ns, st_size)``, None if it cannot be stat'ed.
+        """
+        try:
+            st = self.registry_cache_path.stat()
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+
     def is_cache_outdated(self) -> bool:
         """Check if the cached registry is outdated.
         
@@ -4,30 +4,17 @@ Template Generator for Hatch packages.
 This module contains functions to generate template files for Hatch MCP server packages.
 Each function generates a specific file for the package template.
 """
-import json
 import logging
 from pathlib import Path
 
+from hatch.json_utils import json_dumps
+
 logger = logging.getLogger("hatch.template_generator")
 
-def generate_init_py():
-    """Generate the __init__.py file content for a template package.
-    
-    Returns:
-        str: Content for __init__.py file.
-    """
-    return "# Hatch package initialization\n"
+# File templates, with {package_name} placeholders filled in by str.format_map
+_INIT_PY_TEMPLATE = "# Hatch package initialization\n"
 
-def generate_mcp_server_py(package_name: str):
-    """Generate the mcp_server.py file content for a template package.
-    
-    Args:
-        package_name (str): Name of the package.
-        
-    Returns:
-        str: Content for mcp_server.py file.
-    """
-    return f"""from mcp.server.fastmcp import FastMCP
+_MCP_SERVER_PY_TEMPLATE = """from mcp.server.fastmcp import FastMCP
 
 mcp = FastMCP(\"{package_name}\", log_level=\"WARNING\")
 
@@ -47,16 +34,7 @@ if __name__ == \"__main__\":
     mcp.run()
 """
 
-def generate_hatch_mcp_server_entry_py(package_name: str):
-    """Generate the hatch_mcp_server_entry.py file content for a template package.
-    
-    Args:
-        package_name (str): Name of the package.
-    
-    Returns:
-        str: Content for hatch_mcp_server_entry.py file.
-    """
-    return f"""from hatch_mcp_server import HatchMCP
+_HATCH_MCP_SERVER_ENTRY_PY_TEMPLATE = """from hatch_mcp_server import HatchMCP
 from mcp_server import mcp
 
 hatch_mcp = HatchMCP(\"{package_name}\",
@@ -68,6 +46,45 @@ if __name__ == \"__main__\":
     hatch_mcp.server.run()
 """
 
+_README_MD_TEMPLATE = """# {package_name}
+
+{description}
+
+## Tools
+
+- **example_tool**: Example tool function
+"""
+
+def generate_init_py():
+    """Generate the __init__.py file content for a template package.
+    
+    Returns:
+        str: Content for __init__.py file.
+    """
+    return _INIT_PY_TEMPLATE
+
+def generate_mcp_server_py(package_name: str):
+    """Generate the mcp_server.py file content for a template package.
+    
+    Args:
+        package_name (str): Name of the package.
+        
+    Returns:
+        str: Content for mcp_server.py file.
+    """
+    return _MCP_SERVER_PY_TEMPLATE.format_map({"package_name": package_name})
+
+def generate_hatch_mcp_server_entry_py(package_name: str):
+    """Generate the hatch_mcp_server_entry.py file content for a template package.
+    
+    Args:
+        package_name (str): Name of the package.
+    
+    Returns:
+        str: Content for hatch_mcp_server_entry.py file.
+    """
+    return _HATCH_MCP_SERVER_ENTRY_PY_TEMPLATE.format_map({"package_name": package_name})
+
 def generate_metadata_json(package_name: str, description: str = ""):
     """Generate the metadata JSON content for a template package.
     
@@ -118,14 +135,7 @@ def generate_readme_md(package_name: str, description: str = ""):
     Returns:
         str: Content for README.md file.
     """
-    return f"""# {package_name}
-
-{description}
-
-## Tools
-
-- **example_tool**: Example tool function
-"""
+    return _README_MD_TEMPLATE.format_map({"package_name": package_name, "description": description})
 
 def create_package_template(target_dir: Path, package_name: str, description: str = "") -> Path:
     """Create a package template directory with all necessary files.
@@ -146,36 +156,22 @@ def create_package_template(target_dir: Path, package_name: str, description: st
     Returns:
         Path: Path to the created package directory.
     """
-    logger.info(f"Creating package template for {package_name} in {target_dir}")
+    logger.info("Creating package template for %s in %s", package_name, target_dir)
     
     # Create package directory
     package_dir = target_dir / package_name
     package_dir.mkdir(parents=True, exist_ok=True)
     
-    # Create __init__.py
-    init_content = generate_init_py()
-    with open(package_dir / "__init__.py", 'w') as f:
-        f.write(init_content)
-    
-    # Create mcp_server.py
-    mcp_server_content = generate_mcp_server_py(package_name)
-    with open(package_dir / "mcp_server.py", 'w') as f:
-        f.write(mcp_server_content)
-    
-    # Create hatch_mcp_server_entry.py
-    hatch_mcp_server_entry_content = generate_hatch_mcp_server_entry_py(package_name)
-    with open(package_dir / "hatch_mcp_server_entry.py", 'w') as f:
-        f.write(hatch_mcp_server_entry_content)
-    
-    # Create metadata.json
-    metadata = generate_metadata_json(package_name, description)
-    with open(package_dir / "hatch_metadata.json", 'w') as f:
-        json.dump(metadata, f, indent=2)
-    
-    # Create README.md
-    readme_content = generate_readme_md(package_name, description)
-    with open(package_dir / "README.md", 'w') as f:
-        f.write(readme_content)
+    # Each file is written in a single call from its encoded content
+    files = {
+        "__init__.py": generate_init_py().encode('utf-8'),
+        "mcp_server.py": generate_mcp_server_py(package_name).encode('utf-8'),
+        "hatch_mcp_server_entry.py": generate_hatch_mcp_server_entry_py(package_name).encode('utf-8'),
+        "hatch_metadata.json": json_dumps(generate_metadata_json(package_name, description), pretty=True),
+        "README.md": generate_readme_md(package_name, description).encode('utf-8'),
+    }
+    for file_name, content in files.items():
+        (package_dir / file_name).write_bytes(content)
     
-    logger.info(f"Package template created successfully at {package_dir}")
+    logger.info("Package template created successfully at %s", package_dir)
     return package_dir
@@ -4,25 +4,48 @@ This module provides utilities for loading test data from static test packages.
 All dynamic package generation has been removed in favor of static packages.
 """
 
-import json
+import copy
+from functools import cache, lru_cache
 from pathlib import Path
 from typing import Any, Dict, List
 
+from hatch.json_utils import json_loads
+
+
+@lru_cache(maxsize=None)
+def _load_json_cached(path_str: str) -> Any:
+    """Parse a JSON test data file once per process."""
+    return json_loads(Path(path_str).read_bytes())
+
+
+def _load_json(path: Path) -> Any:
+    """Load a JSON test data file.
+
+    Returns a copy of the memoized content so callers can modify it freely.
+    """
+    return copy.deepcopy(_load_json_cached(str(path)))
+
 
 class TestDataLoader:
     """Utility class for loading test data from standardized locations."""
+
+    __slots__ = ("test_data_dir", "configs_dir", "responses_dir", "packages_dir", "fixtures_dir")
+
+    # Standard locations, resolved once for all instances
+    _TEST_DATA_DIR = Path(__file__).parent / "test_data"
+    _CONFIGS_DIR = _TEST_DATA_DIR / "configs"
+    _RESPONSES_DIR = _TEST_DATA_DIR / "responses"
+    _PACKAGES_DIR = _TEST_DATA_DIR / "packages"
+    _FIXTURES_DIR = _TEST_DATA_DIR / "fixtures"
     
     def __init__(self):
         """Initialize the test data loader."""
-        self.test_data_dir = Path(__file__).parent / "test_data"
-        self.configs_dir = self.test_data_dir / "configs"
-        self.responses_dir = self.test_data_dir / "responses"
-        self.packages_dir = self.test_data_dir / "packages"
-        
-        # Ensure directories exist
-        self.configs_dir.mkdir(parents=True, exist_ok=True)
-        self.responses_dir.mkdir(parents=True, exist_ok=True)
-        self.packages_dir.mkdir(parents=True, exist_ok=True)
+        self.test_data_dir = self._TEST_DATA_DIR
+        self.configs_dir = self._CONFIGS_DIR
+        self.responses_dir = self._RESPONSES_DIR
+        self.packages_dir = self._PACKAGES_DIR
+        self.fixtures_dir = self._FIXTURES_DIR
+        # The directories are checked in, so nothing is created here
     
     def load_config(self, config_name: str) -> Dict[str, Any]:
         """Load a test configuration file.
@@ -32,14 +55,12 @@ class TestDataLoader:
             
         Returns:
             Loaded configuration as a dictionary
+
+        Raises:
+            FileNotFoundError: If the config file does not exist
         """
         config_path = self.configs_dir / f"{config_name}.json"
-        if not config_path.exists():
-            # Create default config if it doesn't exist
-            self._create_default_config(config_name)
-        
-        with open(config_path, 'r') as f:
-            return json.load(f)
+        return _load_json(config_path)
     
     def load_response(self, response_name: str) -> Dict[str, Any]:
         """Load a mock response file.
@@ -49,14 +70,12 @@ class TestDataLoader:
             
         Returns:
             Loaded response as a dictionary
+
+        Raises:
+            FileNotFoundError: If the response file does not exist
         """
         response_path = self.responses_dir / f"{response_name}.json"
-        if not response_path.exists():
-            # Create default response if it doesn't exist
-            self._create_default_response(response_name)
-        
-        with open(response_path, 'r') as f:
-            return json.load(f)
+        return _load_json(response_path)
     
     def setup(self):
         """Set up test data (placeholder for future setup logic)."""
@@ -64,9 +83,11 @@ class TestDataLoader:
         pass
     
     def cleanup(self):
-        """Clean up test data (placeholder for future cleanup logic)."""
-        # Currently no cleanup needed as test packages are persistent
-        pass
+        """Clean up test data.
+
+        Test packages are persistent; only the memoized JSON data is dropped.
+        """
+        _load_json_cached.cache_clear()
     
     def get_test_packages_dir(self) -> Path:
         """Get the test packages directory path.
@@ -76,52 +97,6 @@ class TestDataLoader:
         """
         return self.packages_dir
     
-    def _create_default_config(self, config_name: str):
-        """Create a default configuration file."""
-        default_configs = {
-            "test_settings": {
-                "test_timeout": 30,
-                "temp_dir_prefix": "hatch_test_",
-                "cleanup_temp_dirs": True,
-                "mock_external_services": True
-            },
-            "installer_configs": {
-                "python_installer": {
-                    "pip_timeout": 60,
-                    "use_cache": False
-                },
-                "docker_installer": {
-                    "timeout": 120,
-                    "cleanup_containers": True
-                }
-            }
-        }
-        
-        config = default_configs.get(config_name, {})
-        config_path = self.configs_dir / f"{config_name}.json"
-        with open(config_path, 'w') as f:
-            json.dump(config, f, indent=2)
-    
-    def _create_default_response(self, response_name: str):
-        """Create a default response file."""
-        default_responses = {
-            "registry_responses": {
-                "success": {
-                    "status": "success",
-                    "data": {"packages": []}
-                },
-                "error": {
-                    "status": "error",
-                    "message": "Registry not available"
-                }
-            }
-        }
-        
-        response = default_responses.get(response_name, {})
-        response_path = self.responses_dir / f"{response_name}.json"
-        with open(response_path, 'w') as f:
-            json.dump(response, f, indent=2)
-
     def load_fixture(self, fixture_name: str) -> Dict[str, Any]:
         """Load a test fixture file.
 
@@ -131,15 +106,21 @@ class TestDataLoader:
         Returns:
             Loaded fixture as a dictionary
         """
-        fixtures_dir = self.test_data_dir / "fixtures"
-        fixture_path = fixtures_dir / f"{fixture_name}.json"
-        with open(fixture_path, 'r') as f:
-            return json.load(f)
+        fixture_path = self.fixtures_dir / f"{fixture_name}.json"
+        return _load_json(fixture_path)
 
 
 class NonTTYTestDataLoader(TestDataLoader):
     """Specialized test data loader for non-TTY handling tests."""
 
+    __slots__ = ("_installation_plans", "_non_tty_config")
+
+    def __init__(self):
+        """Initialize the loader; its fixtures are loaded on first use."""
+        super().__init__()
+        self._installation_plans = None
+        self._non_tty_config = None
+
     def get_installation_plan(self, plan_name: str) -> Dict[str, Any]:
         """Load standardized installation plan data.
 
@@ -149,8 +130,14 @@ class NonTTYTestDataLoader(TestDataLoader):
         Returns:
             Installation plan dictionary
         """
-        plans = self.load_fixture("installation_plans")
-        return plans.get(plan_name, plans["basic_python_plan"])
+        plans = self._get_installation_plans()
+        return copy.deepcopy(plans.get(plan_name, plans["basic_python_plan"]))
+
+    def _get_installation_plans(self) -> Dict[str, Any]:
+        """Installation plans fixture, loaded once per loader instance."""
+        if self._installation_plans is None:
+            self._installation_plans = self.load_fixture("installation_plans")
+        return self._installation_plans
 
     def get_non_tty_config(self) -> Dict[str, Any]:
         """Load non-TTY test configuration.
@@ -160,14 +147,23 @@ class NonTTYTestDataLoader(TestDataLoader):
         """
         return self.load_config("non_tty_test_config")
 
+    def _get_cached_non_tty_config(self) -> Dict[str, Any]:
+        """Non-TTY test configuration, loaded once per loader instance.
+
+        The returned dictionary is shared; callers hand out copies of its parts.
+        """
+        if self._non_tty_config is None:
+            self._non_tty_config = self.get_non_tty_config()
+        return self._non_tty_config
+
     def get_environment_variable_scenarios(self) -> List[Dict[str, Any]]:
         """Get environment variable test scenarios.
 
         Returns:
             List of environment variable test scenarios
         """
-        config = self.get_non_tty_config()
-        return config["environment_variables"]["test_scenarios"]
+        config = self._get_cached_non_tty_config()
+        return copy.deepcopy(config["environment_variables"]["test_scenarios"])
 
     def get_user_input_scenarios(self) -> Dict[str, List[str]]:
         """Get user input test scenarios.
@@ -175,8 +171,8 @@ class NonTTYTestDataLoader(TestDataLoader):
         Returns:
             Dictionary of user input scenarios
         """
-        config = self.get_non_tty_config()
-        return config["user_input_scenarios"]
+        config = self._get_cached_non_tty_config()
+        return copy.deepcopy(config["user_input_scenarios"])
 
     def get_logging_messages(self) -> Dict[str, str]:
         """Get expected logging messages.
@@ -184,25 +180,35 @@ class NonTTYTestDataLoader(TestDataLoader):
         Returns:
             Dictionary of expected logging messages
         """
-        config = self.get_non_tty_config()
-        return config["logging_messages"]
+        config = self._get_cached_non_tty_config()
+        return copy.deepcopy(config["logging_messages"])
+
+
+# Shared instance for the convenience functions, created on first use rather than at import
+@cache
+def _loader() -> TestDataLoader:
+    """Get the shared test data loader."""
+    return TestDataLoader()
 
 
-# Global instance for easy access
-test_data = TestDataLoader()
+def __getattr__(name: str) -> Any:
+    """Provide the former module-level ``test_data`` instance lazily (PEP 562)."""
+    if name == "test_data":
+        return _loader()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 # Convenience functions
 def load_test_config(config_name: str) -> Dict[str, Any]:
     """Load test configuration."""
-    return test_data.load_config(config_name)
+    return _loader().load_config(config_name)
 
 
 def load_mock_response(response_name: str) -> Dict[str, Any]:
     """Load mock response."""
-    return test_data.load_response(response_name)
+    return _loader().load_response(response_name)
 
 
 def get_test_packages_dir() -> Path:
     """Get test packages directory."""
-    return test_data.get_test_packages_dir()
+    return _loader().get_test_packages_dir()
@@ -14,45 +14,73 @@ from wobble.decorators import regression_test, integration_test, slow_test
 # Import path management removed - using test_data_utils for test dependencies
 
 from hatch.environment_manager import HatchEnvironmentManager
+from hatch.json_utils import json_dumps
 from hatch.installers.docker_installer import DOCKER_DAEMON_AVAILABLE
 
 # Configure logging
 logging.basicConfig(
-    level=logging.INFO,
+    level=logging.WARNING,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 )
 logger = logging.getLogger("hatch.environment_tests")
 
+
+def _load_metadata(path_str):
+    """Load a package's hatch_metadata.json."""
+    with open(path_str, 'r') as f:
+        return json.load(f)
+
 class PackageEnvironmentTests(unittest.TestCase):
     """Tests for the package environment management functionality."""
-    
+
+    @classmethod
+    def setUpClass(cls):
+        """Create the sample registry shared by all tests of the class."""
+        # Path to Hatching-Dev packages
+        cls.hatch_dev_path = Path(__file__).parent.parent.parent / "Hatching-Dev"
+
+        # The registry is only read by the tests, so it is built once
+        cls._class_temp_dir = tempfile.mkdtemp()
+        # Registered before anything else can fail, so the directory never leaks
+        cls.addClassCleanup(shutil.rmtree, cls._class_temp_dir, ignore_errors=True)
+        cls._create_sample_registry()
+
+        # Override environment paths to use our test directory
+        cls.env_dir = Path(cls._class_temp_dir) / "envs"
+        cls.env_dir.mkdir(exist_ok=True)
+
+        # Create one environment manager for the class; its state is reset before each test
+        cls.env_manager = HatchEnvironmentManager(
+            environments_dir=cls.env_dir,
+            simulation_mode=True,
+            local_registry_cache_path=cls.registry_path)
+
     def setUp(self):
         """Set up test environment before each test."""
-        # Create a temporary directory for test environments
-        self.temp_dir = tempfile.mkdtemp()
-        
-        # Path to Hatching-Dev packages
-        self.hatch_dev_path = Path(__file__).parent.parent.parent / "Hatching-Dev"
         self.assertTrue(self.hatch_dev_path.exists(), 
                         f"Hatching-Dev directory not found at {self.hatch_dev_path}")
-        
-        # Create a sample registry that includes Hatching-Dev packages
-        self._create_sample_registry()
-        
-        # Override environment paths to use our test directory
-        env_dir = Path(self.temp_dir) / "envs"
-        env_dir.mkdir(exist_ok=True)
-        
-        # Create environment manager for testing with isolated test directories
-        self.env_manager = HatchEnvironmentManager(
-            environments_dir=env_dir,
-            simulation_mode=True,
-            local_registry_cache_path=self.registry_path)
-        
-        # Reload environments to ensure clean state
+
+        self._reset_env_manager()
+
+    def _reset_env_manager(self):
+        """Empty the environments directory and reload the shared manager from it."""
+        for entry in self.env_dir.iterdir():
+            if entry.is_dir() and not entry.is_symlink():
+                shutil.rmtree(entry)
+            else:
+                entry.unlink()
+
+        # Reloading an empty directory recreates the default environment, as a new manager would
         self.env_manager.reload_environments()
+        self.env_manager.set_current_environment("default")
         
-    def _create_sample_registry(self):
+    def _prime_env(self, name="test_env", create_python_env=False):
+        """Create an environment and make it the current one."""
+        self.env_manager.create_environment(name, "Test environment", create_python_env=create_python_env)
+        self.env_manager.set_current_environment(name)
+
+    @classmethod
+    def _create_sample_registry(cls):
         """Create a sample registry with Hatching-Dev packages using real metadata."""
         now = datetime.now().isoformat()
         registry = {
@@ -61,7 +89,7 @@ class PackageEnvironmentTests(unittest.TestCase):
             "repositories": [
                 {
                     "name": "test-repo",
-                    "url": f"file://{self.hatch_dev_path}",
+                    "url": f"file://{cls.hatch_dev_path}",
                     "last_indexed": now,
                     "packages": []
                 }
@@ -93,8 +121,7 @@ class PackageEnvironmentTests(unittest.TestCase):
                 metadata_path = pkg_path / "hatch_metadata.json"
                 if metadata_path.exists():
                     try:
-                        with open(metadata_path, 'r') as f:
-                            metadata = json.load(f)
+                        metadata = _load_metadata(str(metadata_path))
                         pkg_entry = {
                             "name": metadata.get("name", pkg_name),
                             "description": metadata.get("description", ""),
@@ -137,18 +164,12 @@ class PackageEnvironmentTests(unittest.TestCase):
         # Update stats
         registry["stats"]["total_packages"] = len(registry["repositories"][0]["packages"])
         registry["stats"]["total_versions"] = sum(len(pkg["versions"]) for pkg in registry["repositories"][0]["packages"])
-        registry_dir = Path(self.temp_dir) / "registry"
+        registry_dir = Path(cls._class_temp_dir) / "registry"
         registry_dir.mkdir(parents=True, exist_ok=True)
-        self.registry_path = registry_dir / "hatch_packages_registry.json"
-        with open(self.registry_path, "w") as f:
-            json.dump(registry, f, indent=2)
-        logger.info(f"Sample registry created at {self.registry_path}")
+        cls.registry_path = registry_dir / "hatch_packages_registry.json"
+        cls.registry_path.write_bytes(json_dumps(registry))
+        logger.info(f"Sample registry created at {cls.registry_path}")
         
-    def tearDown(self):
-        """Clean up test environment after each test."""
-        # Remove temporary directory
-        shutil.rmtree(self.temp_dir)
-    
     @regression_test
     @slow_test
     def test_create_environment(self):
@@ -198,13 +219,37 @@ class PackageEnvironmentTests(unittest.TestCase):
         current_env = self.env_manager.get_current_environment()
         self.assertEqual(current_env, "test_env", "Current environment not set correctly")
 
+    @regression_test
+    def test_add_package_saves_environments_once(self):
+        """Test that all installed Hatch packages are persisted with a single save."""
+        self._prime_env()
+
+        installed = [
+            {"name": name, "version": "1.0.0", "type": "hatch", "source": "local"}
+            for name in ("base_pkg", "utility_pkg", "complex_dep_pkg")
+        ]
+        installed.append({"name": "numpy", "version": "1.0.0", "type": "python", "source": "pip"})
+
+        with patch.object(self.env_manager.dependency_orchestrator, "install_dependencies",
+                          return_value=(True, installed)), \
+             patch.object(self.env_manager, "_save_environments",
+                          wraps=self.env_manager._save_environments) as mock_save:
+            result = self.env_manager.add_package_to_environment("complex_dep_pkg", "test_env", auto_approve=True)
+
+        self.assertTrue(result, "Failed to add package to environment")
+        mock_save.assert_called_once()
+
+        # Reload from disk to check that every Hatch package was written
+        self.env_manager.reload_environments()
+        package_names = {pkg["name"] for pkg in self.env_manager.get_environments()["test_env"]["packages"]}
+        self.assertEqual(package_names, {"base_pkg", "utility_pkg", "complex_dep_pkg"})
+
     @regression_test
     @slow_test
     def test_add_local_package(self):
         """Test adding a local package to an environment."""
         # Create an environment
-        self.env_manager.create_environment("test_env", "Test environment")
-        self.env_manager.set_current_environment("test_env")
+        self._prime_env(create_python_env=True)
 
         # Use base_pkg from self-contained test data
         from test_data_utils import TestDataLoader
@@ -239,8 +284,7 @@ class PackageEnvironmentTests(unittest.TestCase):
     def test_add_package_with_dependencies(self):
         """Test adding a package with dependencies to an environment."""
         # Create an environment
-        self.env_manager.create_environment("test_env", "Test environment", create_python_env=False)
-        self.env_manager.set_current_environment("test_env")
+        self._prime_env()
 
         # First add the base package that is a dependency
         from test_data_utils import TestDataLoader
@@ -276,7 +320,7 @@ class PackageEnvironmentTests(unittest.TestCase):
         self.assertEqual(len(packages), 2, "Not all packages were added to environment")
         
         # Check that both packages are in the environment data
-        package_names = [pkg["name"] for pkg in packages]
+        package_names = {pkg["name"] for pkg in packages}
         self.assertIn("base_pkg", package_names, "Base package missing from environment")
         self.assertIn("simple_dep_pkg", package_names, "Dependent package missing from environment")
     
@@ -285,8 +329,7 @@ class PackageEnvironmentTests(unittest.TestCase):
     def test_add_package_with_some_dependencies_already_present(self):
         """Test adding a package where some dependencies are already present and others are not."""
         # Create an environment
-        self.env_manager.create_environment("test_env", "Test environment", create_python_env=False)
-        self.env_manager.set_current_environment("test_env")
+        self._prime_env()
         # First add only one of the dependencies that complex_dep_pkg needs
         from test_data_utils import TestDataLoader
         test_loader = TestDataLoader()
@@ -325,18 +368,16 @@ class PackageEnvironmentTests(unittest.TestCase):
 
         # Should have base_pkg (already present), utility_pkg, and complex_dep_pkg
         expected_packages = ["base_pkg", "utility_pkg", "complex_dep_pkg"]
-        package_names = [pkg["name"] for pkg in packages]
+        package_names = {pkg["name"] for pkg in packages}
         
-        for pkg_name in expected_packages:
-            self.assertIn(pkg_name, package_names, f"Package {pkg_name} missing from environment")
+        self.assertLessEqual(set(expected_packages), package_names, "Packages missing from environment")
     
     @regression_test
     @slow_test
     def test_add_package_with_all_dependencies_already_present(self):
         """Test adding a package where all dependencies are already present."""
         # Create an environment
-        self.env_manager.create_environment("test_env", "Test environment", create_python_env=False)
-        self.env_manager.set_current_environment("test_env")
+        self._prime_env()
         # First add all dependencies that simple_dep_pkg needs
         from test_data_utils import TestDataLoader
         test_loader = TestDataLoader()
@@ -373,19 +414,17 @@ class PackageEnvironmentTests(unittest.TestCase):
         
         # Should have base_pkg (already present) and simple_dep_pkg (newly added)
         expected_packages = ["base_pkg", "simple_dep_pkg"]
-        package_names = [pkg["name"] for pkg in packages]
+        package_names = {pkg["name"] for pkg in packages}
 
         self.assertEqual(len(packages), 2, "Unexpected number of packages in environment")
-        for pkg_name in expected_packages:
-            self.assertIn(pkg_name, package_names, f"Package {pkg_name} missing from environment")
+        self.assertEqual(package_names, set(expected_packages), "Unexpected packages in environment")
     
     @regression_test
     @slow_test
     def test_add_package_with_version_constraint_satisfaction(self):
         """Test adding a package with version constraints where dependencies are satisfied."""
         # Create an environment
-        self.env_manager.create_environment("test_env", "Test environment", create_python_env=False)
-        self.env_manager.set_current_environment("test_env")
+        self._prime_env()
 
         # Add base_pkg with a specific version
         from test_data_utils import TestDataLoader
@@ -416,7 +455,7 @@ class PackageEnvironmentTests(unittest.TestCase):
         # Verify packages are correctly installed
         env_data = self.env_manager.get_environments().get("test_env")
         packages = env_data.get("packages", [])
-        package_names = [pkg["name"] for pkg in packages]
+        package_names = {pkg["name"] for pkg in packages}
 
         self.assertIn("base_pkg", package_names, "Base package missing from environment")
         self.assertIn("simple_dep_pkg", package_names, "Dependent package missing from environment")
@@ -426,8 +465,7 @@ class PackageEnvironmentTests(unittest.TestCase):
     def test_add_package_with_mixed_dependency_types(self):
         """Test adding a package with mixed hatch and python dependencies."""
         # Create an environment
-        self.env_manager.create_environment("test_env", "Test environment")
-        self.env_manager.set_current_environment("test_env")
+        self._prime_env(create_python_env=True)
 
         # Add a package that has both hatch and python dependencies
         from test_data_utils import TestDataLoader
@@ -446,7 +484,7 @@ class PackageEnvironmentTests(unittest.TestCase):
         # Verify package was added
         env_data = self.env_manager.get_environments().get("test_env")
         packages = env_data.get("packages", [])
-        package_names = [pkg["name"] for pkg in packages]
+        package_names = {pkg["name"] for pkg in packages}
 
         self.assertIn("python_dep_pkg", package_names, "Package with mixed dependencies missing from environment")
 
@@ -466,7 +504,7 @@ class PackageEnvironmentTests(unittest.TestCase):
         # Verify all expected packages are present
         env_data = self.env_manager.get_environments().get("test_env")
         packages = env_data.get("packages", [])
-        package_names = [pkg["name"] for pkg in packages]
+        package_names = {pkg["name"] for pkg in packages}
         
         # Should have python_dep_pkg (already present) plus any other dependencies of complex_dep_pkg
         self.assertIn("python_dep_pkg", package_names, "Originally installed package missing")
@@ -477,7 +515,7 @@ class PackageEnvironmentTests(unittest.TestCase):
         packages = python_env_info.get("packages", [])
         self.assertIsNotNone(packages, "Python environment packages not found")
         self.assertGreater(len(packages), 0, "No packages found in Python environment")
-        package_names = [pkg["name"] for pkg in packages]
+        package_names = {pkg["name"] for pkg in packages}
         self.assertIn("requests", package_names, f"Expected 'requests' package not found in Python environment: {packages}")
 
     @integration_test(scope="system")
@@ -485,8 +523,7 @@ class PackageEnvironmentTests(unittest.TestCase):
     @unittest.skipIf(sys.platform.startswith("win"), "System dependency test skipped on Windows")
     def test_add_package_with_system_dependency(self):
         """Test adding a package with a system dependency."""
-        self.env_manager.create_environment("test_env", "Test environment", create_python_env=False)
-        self.env_manager.set_current_environment("test_env")
+        self._prime_env()
         # Add a package that declares a system dependency (e.g., 'curl')
         system_dep_pkg_path = self.hatch_dev_path / "system_dep_pkg"
         self.assertTrue(system_dep_pkg_path.exists(), f"System dependency package not found: {system_dep_pkg_path}")
@@ -501,7 +538,7 @@ class PackageEnvironmentTests(unittest.TestCase):
         # Verify package was added
         env_data = self.env_manager.get_environments().get("test_env")
         packages = env_data.get("packages", [])
-        package_names = [pkg["name"] for pkg in packages]
+        package_names = {pkg["name"] for pkg in packages}
         self.assertIn("system_dep_pkg", package_names, "System dependency package missing from environment")
 
     # Skip if Docker is not available
@@ -510,8 +547,7 @@ class PackageEnvironmentTests(unittest.TestCase):
     @unittest.skipUnless(DOCKER_DAEMON_AVAILABLE, "Docker dependency test skipped due to Docker not being available")
     def test_add_package_with_docker_dependency(self):
         """Test adding a package with a docker dependency."""
-        self.env_manager.create_environment("test_env", "Test environment", create_python_env=False)
-        self.env_manager.set_current_environment("test_env")
+        self._prime_env()
         # Add a package that declares a docker dependency (e.g., 'redis:latest')
         docker_dep_pkg_path = self.hatch_dev_path / "docker_dep_pkg"
         self.assertTrue(docker_dep_pkg_path.exists(), f"Docker dependency package not found: {docker_dep_pkg_path}")
@@ -526,7 +562,7 @@ class PackageEnvironmentTests(unittest.TestCase):
         # Verify package was added
         env_data = self.env_manager.get_environments().get("test_env")
         packages = env_data.get("packages", [])
-        package_names = [pkg["name"] for pkg in packages]
+        package_names = {pkg["name"] for pkg in packages}
         self.assertIn("docker_dep_pkg", package_names, "Docker dependency package missing from environment")
 
     @regression_test
@@ -582,7 +618,7 @@ class PackageEnvironmentTests(unittest.TestCase):
             # Verify MCP server package is in environment
             env_data = self.env_manager._environments["test_mcp_default"]
             packages = env_data.get("packages", [])
-            package_names = [pkg["name"] for pkg in packages]
+            package_names = {pkg["name"] for pkg in packages}
             expected_name = "hatch_mcp_server @ git+https://github.com/CrackingShells/Hatch-MCP-Server.git"
             self.assertIn(expected_name, package_names, "MCP server should be installed by default with correct name syntax")
             
@@ -627,7 +663,7 @@ class PackageEnvironmentTests(unittest.TestCase):
             # Verify MCP server package is NOT in environment
             env_data = self.env_manager._environments["test_mcp_opt_out"]
             packages = env_data.get("packages", [])
-            package_names = [pkg["name"] for pkg in packages]
+            package_names = {pkg["name"] for pkg in packages}
             expected_name = "hatch_mcp_server @ git+https://github.com/CrackingShells/Hatch-MCP-Server.git"
             self.assertNotIn(expected_name, package_names, "MCP server should not be installed when opted out")
 
@@ -777,7 +813,7 @@ class PackageEnvironmentTests(unittest.TestCase):
             # Verify MCP server package is in environment
             env_data = self.env_manager._environments["test_existing_mcp"]
             packages = env_data.get("packages", [])
-            package_names = [pkg["name"] for pkg in packages]
+            package_names = {pkg["name"] for pkg in packages}
             expected_name = f"hatch_mcp_server @ git+https://github.com/CrackingShells/Hatch-MCP-Server.git@v0.2.0"
             self.assertIn(expected_name, package_names, "MCP server should be installed in environment with correct name syntax")
 
@@ -849,7 +885,7 @@ class PackageEnvironmentTests(unittest.TestCase):
             
             # Verify MCP wrapper was installed
             packages = env_data.get("packages", [])
-            package_names = [pkg["name"] for pkg in packages]
+            package_names = {pkg["name"] for pkg in packages}
             expected_name = "hatch_mcp_server @ git+https://github.com/CrackingShells/Hatch-MCP-Server.git"
             self.assertIn(expected_name, package_names, "MCP wrapper should be installed")
             
@@ -3,6 +3,7 @@
 This module contains tests for the Python environment management functionality,
 including conda/mamba environment creation, configuration, and integration.
 """
+import json
 import shutil
 import tempfile
 import unittest
@@ -315,7 +316,7 @@ class TestPythonEnvironmentManager(unittest.TestCase):
         mock_run.side_effect = run_side_effect
 
         # Mock that the file exists
-        with patch('pathlib.Path.exists', return_value=True):
+        with patch('pathlib.Path.is_file', return_value=True):
             result = self.manager.get_python_executable(env_name)
             import platform
             from pathlib import Path as _Path
@@ -325,6 +326,39 @@ class TestPythonEnvironmentManager(unittest.TestCase):
                 expected = str(_Path("/conda/envs/hatch_test_env/bin/python"))
             self.assertEqual(result, expected)
 
+    @regression_test
+    @patch('subprocess.run')
+    def test_python_executable_path_cached_between_calls(self, mock_run):
+        """Test that a resolved executable is reused while it exists and resolved again once removed."""
+        import platform
+        env_path = Path(self.temp_dir) / "conda" / "envs" / "hatch_test_env"
+        if platform.system() == "Windows":
+            python_path = env_path / "python.exe"
+        else:
+            python_path = env_path / "bin" / "python"
+        python_path.parent.mkdir(parents=True)
+        python_path.touch()
+
+        mock_run.return_value = Mock(returncode=0, stdout=json.dumps({"envs": [str(env_path)]}))
+        self.manager.conda_executable = "/usr/bin/conda"
+
+        self.assertEqual(self.manager.get_python_executable("test_env"), str(python_path))
+        self.assertEqual(self.manager.get_python_executable("test_env"), str(python_path))
+        self.assertTrue(self.manager.environment_exists("test_env"))
+        self.assertEqual(self.manager.get_environment_path("test_env"), env_path)
+        # conda was asked once; later lookups were answered from the resolved path
+        self.assertEqual(mock_run.call_count, 1)
+
+        # An executable removed outside the manager is reported right away
+        python_path.unlink()
+        self.assertIsNone(self.manager.get_python_executable("test_env"))
+
+        # Once recreated, the executable is resolved through conda again
+        python_path.touch()
+        calls = mock_run.call_count
+        self.assertEqual(self.manager.get_python_executable("test_env"), str(python_path))
+        self.assertEqual(mock_run.call_count, calls + 1)
+
     @regression_test
     def test_get_python_executable_not_exists(self):
         """Test getting Python executable when environment doesn't exist."""
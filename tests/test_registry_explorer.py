@@ -0,0 +1,216 @@
+import unittest
+
+from packaging.specifiers import SpecifierSet
+from wobble.decorators import regression_test
+
+from hatch.registry_explorer import (
+    find_repository,
+    list_repositories,
+    find_package,
+    list_packages,
+    find_package_version,
+    get_package_release_url,
+    RegistryIndex,
+    _match_version_constraint
+)
+
+
+def _make_registry():
+    """Build a small in-memory registry with two repositories."""
+    return {
+        "registry_schema_version": "1.1.0",
+        "last_updated": "2025-01-01T00:00:00Z",
+        "repositories": [
+            {
+                "name": "main",
+                "packages": [
+                    {
+                        "name": "base_pkg",
+                        "latest_version": "1.1.0",
+                        "versions": [
+                            {"version": "1.0.0", "release_uri": "https://example.com/base_pkg-1.0.0.zip"},
+                            {"version": "1.1.0", "release_uri": "https://example.com/base_pkg-1.1.0.zip"},
+                        ]
+                    },
+                    {
+                        "name": "utility_pkg",
+                        "latest_version": "0.2.0",
+                        "versions": [
+                            {"version": "0.1.0", "release_uri": "https://example.com/utility_pkg-0.1.0.zip"},
+                            {"version": "0.2.0", "release_uri": "https://example.com/utility_pkg-0.2.0.zip"},
+                        ]
+                    }
+                ]
+            },
+            {
+                "name": "extra",
+                "packages": [
+                    {
+                        "name": "base_pkg",
+                        "latest_version": "2.0.0",
+                        "versions": [
+                            {"version": "2.0.0", "release_uri": "https://example.com/extra/base_pkg-2.0.0.zip"},
+                        ]
+                    }
+                ]
+            }
+        ]
+    }
+
+
+class RegistryExplorerTests(unittest.TestCase):
+    """Tests for registry lookup helpers."""
+
+    def setUp(self):
+        """Set up a fresh registry before each test."""
+        self.registry = _make_registry()
+
+    @regression_test
+    def test_find_repository(self):
+        """Test repository lookup by name."""
+        self.assertIs(find_repository(self.registry, "extra"), self.registry["repositories"][1])
+        self.assertIsNone(find_repository(self.registry, "missing"))
+
+    @regression_test
+    def test_list_repositories_and_packages(self):
+        """Test listing repositories and packages, globally and per repository."""
+        self.assertEqual(list_repositories(self.registry), ["main", "extra"])
+        self.assertEqual(list_packages(self.registry, "main"), ["base_pkg", "utility_pkg"])
+        self.assertEqual(list_packages(self.registry, "extra"), ["base_pkg"])
+        self.assertEqual(list_packages(self.registry, "missing"), [])
+        self.assertEqual(set(list_packages(self.registry)), {"base_pkg", "utility_pkg"})
+
+    @regression_test
+    def test_find_package_first_repository_wins(self):
+        """Test that a global lookup returns the first repository's package, as a scan would."""
+        pkg = find_package(self.registry, "base_pkg")
+        self.assertEqual(pkg["latest_version"], "1.1.0")
+
+        pkg = find_package(self.registry, "base_pkg", repo_name="extra")
+        self.assertEqual(pkg["latest_version"], "2.0.0")
+
+        self.assertIsNone(find_package(self.registry, "utility_pkg", repo_name="extra"))
+        self.assertIsNone(find_package(self.registry, "missing"))
+
+    @regression_test
+    def test_lookups_through_index_match_scan(self):
+        """Test that lookups given a registry index return what a scan of the registry returns."""
+        index = RegistryIndex(self.registry)
+
+        for repo_name in ("main", "extra", "missing"):
+            self.assertIs(find_repository(self.registry, repo_name, index=index),
+                          find_repository(self.registry, repo_name))
+            self.assertEqual(list_packages(self.registry, repo_name, index=index),
+                             list_packages(self.registry, repo_name))
+            for package_name in ("base_pkg", "utility_pkg", "missing"):
+                self.assertIs(find_package(self.registry, package_name, repo_name, index=index),
+                              find_package(self.registry, package_name, repo_name))
+        self.assertIs(find_package(self.registry, "base_pkg", index=index), find_package(self.registry, "base_pkg"))
+        self.assertEqual(list_repositories(self.registry, index=index), list_repositories(self.registry))
+        self.assertEqual(list_packages(self.registry, index=index), list_packages(self.registry))
+
+    @regression_test
+    def test_lookups_see_registry_changes(self):
+        """Test that lookups reflect changes made to the registry after earlier lookups."""
+        self.assertIsNone(find_package(self.registry, "late_pkg"))
+        self.registry["repositories"].append({"name": "late", "packages": [{"name": "late_pkg"}]})
+
+        self.assertIsNotNone(find_package(self.registry, "late_pkg"))
+        self.assertIsNotNone(find_repository(self.registry, "late"))
+        self.assertEqual(list_packages(self.registry, "late"), ["late_pkg"])
+
+    @regression_test
+    def test_find_package_version(self):
+        """Test version selection with and without constraints."""
+        pkg = find_package(self.registry, "base_pkg")
+
+        self.assertEqual(find_package_version(pkg)["version"], "1.1.0")
+        self.assertEqual(find_package_version(pkg, ">=1.0.0")["version"], "1.1.0")
+        self.assertEqual(find_package_version(pkg, "<1.1.0")["version"], "1.0.0")
+        self.assertEqual(find_package_version(pkg, "1.0.0")["version"], "1.0.0")
+        self.assertEqual(find_package_version(pkg, "==1.0.0")["version"], "1.0.0")
+        self.assertIsNone(find_package_version(pkg, ">=3.0.0"))
+        self.assertEqual(find_package_version(pkg, "~=1.0")["version"], "1.1.0")
+
+        # Repeated lookups must give the same answers
+        self.assertEqual(find_package_version(pkg, "<1.1.0")["version"], "1.0.0")
+
+    @regression_test
+    def test_exact_constraint_matching(self):
+        """Test that equality constraints follow PEP 440 semantics without a SpecifierSet."""
+        self.assertTrue(_match_version_constraint("1.0.0", "==1.0"))
+        self.assertTrue(_match_version_constraint("1.0.0", "1.0.0"))
+        self.assertTrue(_match_version_constraint("1.0.0+local", "==1.0.0"))
+        self.assertFalse(_match_version_constraint("1.0.1", "==1.0.0"))
+        self.assertTrue(_match_version_constraint("1.0.5", "==1.0.*"))
+
+        pkg = find_package(self.registry, "base_pkg")
+        self.assertEqual(find_package_version(pkg, "==1.0")["version"], "1.0.0")
+        self.assertIsNone(find_package_version(pkg, "==1.2.0"))
+
+        pkg["versions"].append({"version": "1.2.0+build1"})
+        self.assertEqual(find_package_version(pkg, "==1.2.0")["version"], "1.2.0+build1")
+
+    @regression_test
+    def test_exact_constraint_prefers_highest_local_version(self):
+        """Test that exact constraints select the highest matching version, local labels included."""
+        pkg = find_package(self.registry, "base_pkg")
+        pkg["versions"].append({"version": "1.0.0+local"})
+
+        self.assertEqual(find_package_version(pkg, "==1.0.0")["version"], "1.0.0+local")
+        self.assertEqual(find_package_version(pkg, "1.0")["version"], "1.0.0+local")
+        self.assertEqual(find_package_version(pkg, "==1.1.0")["version"], "1.1.0")
+
+        # A target with a local label only matches that exact version
+        pkg["versions"].append({"version": "1.1.0+build2"})
+        self.assertEqual(find_package_version(pkg, "==1.0.0+local")["version"], "1.0.0+local")
+        self.assertEqual(find_package_version(pkg, "==1.1.0")["version"], "1.1.0+build2")
+        self.assertIsNone(find_package_version(pkg, "==1.1.0+other"))
+
+    @regression_test
+    def test_find_package_version_unparsable_version(self):
+        """Test that a version that is not PEP 440 compliant is found by its exact spelling."""
+        pkg = find_package(self.registry, "base_pkg")
+        pkg["versions"].append({"version": "dev-build", "release_uri": "https://example.com/base_pkg-dev.zip"})
+
+        self.assertEqual(find_package_version(pkg, "dev-build")["version"], "dev-build")
+        self.assertEqual(get_package_release_url(pkg, "dev-build"), ("https://example.com/base_pkg-dev.zip", "dev-build"))
+        self.assertIsNone(find_package_version(pkg, "other-build"))
+
+    @regression_test
+    def test_range_constraint_matching(self):
+        """Test that range constraints follow PEP 440 rules, including pre and post releases."""
+        self.assertTrue(_match_version_constraint("1.0.0", ">=1.0,<2"))
+        self.assertTrue(_match_version_constraint("1.9.9", ">=1.0,<2"))
+        self.assertFalse(_match_version_constraint("2.0.0", ">=1.0,<2"))
+        self.assertFalse(_match_version_constraint("0.9", ">=1.0,<2"))
+
+        # Pre, post and local releases are left to packaging's own rules
+        for version in ("1.5.0a1", "2.0.0a1", "1.0.0+local", "1.9.post1", "1.0.dev1"):
+            self.assertEqual(_match_version_constraint(version, ">=1.0,<2"),
+                             SpecifierSet(">=1.0,<2").contains(version), version)
+        self.assertFalse(_match_version_constraint("1.0.post1", ">1.0"))
+        self.assertTrue(_match_version_constraint("1.0.0+local", "1.0"))
+        self.assertTrue(_match_version_constraint("1.4", "~=1.2"))
+        self.assertFalse(_match_version_constraint("not-a-version", ">=1.0"))
+
+    @regression_test
+    def test_unparsable_constraint_matches_itself(self):
+        """Test that versions outside PEP 440 match a constraint spelled the same way."""
+        for version in ("dev-build", "abc", "1.0-custom"):
+            self.assertTrue(_match_version_constraint(version, version), version)
+            self.assertFalse(_match_version_constraint("1.0.0", version), version)
+        self.assertFalse(_match_version_constraint("abc", "dev-build"))
+
+    @regression_test
+    def test_get_package_release_url(self):
+        """Test release URI resolution for a constraint."""
+        pkg = find_package(self.registry, "utility_pkg")
+        self.assertEqual(
+            get_package_release_url(pkg, "<0.2.0"),
+            ("https://example.com/utility_pkg-0.1.0.zip", "0.1.0")
+        )
+        self.assertEqual(get_package_release_url(None, "<0.2.0"), (None, None))
+
+if __name__ == "__main__":
+    unittest.main()
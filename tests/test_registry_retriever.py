@@ -5,14 +5,18 @@ import shutil
 import logging
 import json
 import datetime
+import time
+import gzip
 import os
+import requests
 from pathlib import Path
+from unittest.mock import patch, Mock
 
 from wobble.decorators import regression_test, integration_test, slow_test
 
 # Import path management removed - using test_data_utils for test dependencies
 
-from hatch.registry_retriever import RegistryRetriever
+from hatch.registry_retriever import RegistryRetriever, _load_registry_file
 
 # Configure logging
 logging.basicConfig(
@@ -21,6 +25,18 @@ logging.basicConfig(
 )
 logger = logging.getLogger("hatch.registry_tests")
 
+
+def _make_registry():
+    """Build a minimal in-memory registry with no repositories."""
+    return {"registry_schema_version": "1.1.0", "last_updated": "2025-01-01T00:00:00Z", "repositories": []}
+
+
+def _write_cache(path, data):
+    """Write a registry to a JSON file."""
+    with open(path, 'w') as f:
+        json.dump(data, f)
+
+
 class RegistryRetrieverTests(unittest.TestCase):
     """Tests for Registry Retriever functionality."""
 
@@ -62,7 +78,7 @@ class RegistryRetrieverTests(unittest.TestCase):
         # Verify cache path is set correctly
         self.assertEqual(
             online_retriever.registry_cache_path,
-            self.cache_dir / "registry" / "hatch_packages_registry.json"
+            self.cache_dir / "registry" / "hatch_packages_registry.json.gz"
         )
 
         # Also test initialization with local file in simulation mode (for reference)
@@ -246,5 +262,235 @@ class RegistryRetrieverTests(unittest.TestCase):
         retriever._load_last_fetch_time()
         self.assertEqual(retriever._last_fetch_time, 0, "Missing timestamp file should be treated as no timestamp")
 
+    @regression_test
+    def test_conditional_get_reuses_cache_on_not_modified(self):
+        """Test that a 304 answer reuses the local cache and a 404 falls back to yesterday."""
+        registry = _make_registry()
+        retriever = RegistryRetriever(local_cache_dir=self.cache_dir, simulation_mode=False)
+        retriever.registry_cache_path.parent.mkdir(parents=True, exist_ok=True)
+
+        def not_found_today(url, headers=None, **kwargs):
+            if retriever.today_str in url:
+                return Mock(status_code=404)
+            return Mock(
+                status_code=200,
+                headers={"ETag": '"abc"', "Last-Modified": "Wed, 01 Jan 2025 00:00:00 GMT"},
+                content=json.dumps(registry).encode('utf-8')
+            )
+
+        with patch.object(retriever._session, 'get', side_effect=not_found_today):
+            self.assertEqual(retriever.get_registry(force_refresh=True), registry)
+        self.assertTrue(retriever.is_delayed)
+        self.assertTrue(retriever.registry_cache_path.exists())
+        self.assertEqual(json.loads(gzip.decompress(retriever.registry_cache_path.read_bytes())), registry)
+
+        def not_modified(url, headers=None, **kwargs):
+            if retriever.today_str in url:
+                return Mock(status_code=404)
+            self.assertEqual(headers.get("If-None-Match"), '"abc"')
+            return Mock(status_code=304)
+
+        first = retriever._registry_cache
+        with patch.object(retriever._session, 'get', side_effect=not_modified) as mock_get, \
+             patch.object(retriever, '_read_local_cache', wraps=retriever._read_local_cache) as mock_read:
+            self.assertIs(retriever.get_registry(force_refresh=True), first)
+            # The touched but unchanged cache file is not parsed again, now or on a later cache check
+            with patch.object(retriever, 'is_cache_outdated', return_value=False):
+                retriever._last_fetch_monotonic = None
+                self.assertIs(retriever.get_registry(), first)
+            mock_read.assert_not_called()
+        self.assertEqual(mock_get.call_count, 2)
+
+    @regression_test
+    def test_not_modified_with_corrupt_cache_downloads_again(self):
+        """Test that a 304 answer for an unreadable cache triggers an unconditional download."""
+        registry = _make_registry()
+        retriever = RegistryRetriever(local_cache_dir=self.cache_dir, simulation_mode=False)
+        body = json.dumps(registry).encode('utf-8')
+
+        ok = Mock(status_code=200, headers={"ETag": '"abc"'}, content=body)
+        with patch.object(retriever._session, 'get', return_value=ok) as mock_get:
+            retriever.get_registry(force_refresh=True)
+        # Both dates are requested concurrently, and both responses are released
+        self.assertEqual(mock_get.call_count, 2)
+        self.assertEqual(ok.close.call_count, 2)
+
+        retriever.registry_cache_path.write_bytes(b"corrupt")
+        cache_mtime = retriever.registry_cache_path.stat().st_mtime_ns
+        sent_headers = []
+        responses = []
+
+        def answer(url, headers=None, **kwargs):
+            if retriever.today_str not in url:
+                response = Mock(status_code=404)
+            else:
+                sent_headers.append(headers)
+                if headers.get("If-None-Match"):
+                    response = Mock(status_code=304)
+                else:
+                    response = Mock(status_code=200, headers={"ETag": '"def"'}, content=body)
+            responses.append(response)
+            return response
+
+        with patch.object(retriever._session, 'get', side_effect=answer), \
+             patch('hatch.registry_retriever.os.utime') as mock_utime:
+            self.assertEqual(retriever.get_registry(force_refresh=True), registry)
+            mock_utime.assert_not_called()
+
+        # Today's registry is downloaded again, without validators
+        self.assertFalse(retriever.is_delayed)
+        self.assertEqual(len(sent_headers), 2)
+        self.assertEqual(sent_headers[-1], {})
+        # The re-download is released too, not only the concurrent requests
+        self.assertEqual(len(responses), 3)
+        for response in responses:
+            response.close.assert_called_once()
+        self.assertEqual(json.loads(gzip.decompress(retriever.registry_cache_path.read_bytes())), registry)
+        self.assertNotEqual(retriever.registry_cache_path.stat().st_mtime_ns, cache_mtime)
+        self.assertEqual(retriever._load_registry_meta()["etag"], '"def"')
+
+    @regression_test
+    def test_failed_today_request_falls_back_to_yesterday(self):
+        """Test that any failure fetching today's registry falls back to yesterday's."""
+        registry = _make_registry()
+        retriever = RegistryRetriever(local_cache_dir=self.cache_dir, simulation_mode=False)
+
+        def unreachable_today(url, headers=None, **kwargs):
+            if retriever.today_str in url:
+                raise requests.exceptions.ConnectionError("connection reset")
+            return Mock(status_code=200, headers={}, content=json.dumps(registry).encode('utf-8'))
+
+        with patch.object(retriever._session, 'get', side_effect=unreachable_today):
+            self.assertEqual(retriever.get_registry(force_refresh=True), registry)
+        self.assertTrue(retriever.is_delayed)
+
+        # Yesterday's failure is reported once no candidate is left
+        with patch.object(retriever._session, 'get', side_effect=requests.exceptions.ConnectionError("down")):
+            with self.assertRaises(requests.exceptions.ConnectionError):
+                retriever.get_registry(force_refresh=True)
+
+    @regression_test
+    def test_unchanged_cache_file_not_reparsed(self):
+        """Test that an unchanged cache file is not parsed again when the in-memory cache expires."""
+        registry = _make_registry()
+        _write_cache(self.local_registry_path, registry)
+
+        retriever = RegistryRetriever(
+            cache_ttl=0,  # In-memory cache always expired
+            local_cache_dir=self.cache_dir,
+            simulation_mode=True,
+            local_registry_cache_path=self.local_registry_path
+        )
+        first = retriever.get_registry()
+
+        with patch.object(retriever, 'is_cache_outdated', return_value=False), \
+             patch.object(retriever, '_read_local_cache', wraps=retriever._read_local_cache) as mock_read:
+            self.assertIs(retriever.get_registry(), first)
+            mock_read.assert_not_called()
+
+            # Rewriting the file with different content must trigger a new parse
+            registry["repositories"].append({"name": "new_repo", "packages": []})
+            _write_cache(self.local_registry_path, registry)
+            self.assertEqual(retriever.get_registry(), registry)
+            mock_read.assert_called_once()
+
+    @regression_test
+    def test_load_registry_file_plain_and_gzip(self):
+        """Test parsing registry files with and without gzip compression."""
+        registry = _make_registry()
+        registry["repositories"].append({"name": "repo"})
+        plain_path = Path(self.temp_dir) / "plain.json"
+        gzip_path = Path(self.temp_dir) / "compressed.json.gz"
+        _write_cache(plain_path, registry)
+        gzip_path.write_bytes(gzip.compress(json.dumps(registry).encode('utf-8')))
+
+        self.assertEqual(_load_registry_file(plain_path), registry)
+        self.assertEqual(_load_registry_file(gzip_path), registry)
+
+        empty_path = Path(self.temp_dir) / "empty.json"
+        empty_path.write_bytes(b"")
+        with self.assertRaises(ValueError):
+            _load_registry_file(empty_path)
+
+    @regression_test
+    def test_simulation_registry_file_not_rewritten(self):
+        """Test that fetching in simulation mode leaves the local registry file untouched."""
+        _write_cache(self.local_registry_path, _make_registry())
+        content = self.local_registry_path.read_text()
+
+        retriever = RegistryRetriever(
+            local_cache_dir=self.cache_dir,
+            simulation_mode=True,
+            local_registry_cache_path=self.local_registry_path
+        )
+        with patch.object(retriever, '_write_local_cache_bytes') as mock_write:
+            retriever.get_registry(force_refresh=True)
+            mock_write.assert_not_called()
+        self.assertEqual(self.local_registry_path.read_text(), content)
+
+    @regression_test
+    def test_in_memory_ttl_uses_monotonic_clock(self):
+        """Test that the in-memory cache TTL is unaffected by wall-clock changes."""
+        _write_cache(self.local_registry_path, _make_registry())
+
+        retriever = RegistryRetriever(
+            cache_ttl=300,
+            local_cache_dir=self.cache_dir,
+            simulation_mode=True,
+            local_registry_cache_path=self.local_registry_path
+        )
+        first = retriever.get_registry()
+
+        # A wall clock jump does not expire the in-memory cache
+        with patch('hatch.registry_retriever.time.time', return_value=time.time() + 3600):
+            self.assertIs(retriever.get_registry(), first)
+
+        # Passing the TTL on the monotonic clock does
+        with patch('hatch.registry_retriever.time.monotonic', return_value=time.monotonic() + 301), \
+             patch.object(retriever, 'is_cache_outdated', return_value=True):
+            self.assertIsNot(retriever.get_registry(), first)
+
+    @regression_test
+    def test_corrupt_cache_falls_back_to_fetch(self):
+        """Test that an unreadable cache file is replaced by fetching the registry from source."""
+        retriever = RegistryRetriever(local_cache_dir=self.cache_dir, simulation_mode=False)
+        retriever.registry_cache_path.write_bytes(gzip.compress(b"{not json"))
+        registry = _make_registry()
+        registry["repositories"].append({"name": "repo", "packages": []})
+
+        response = Mock(status_code=200, headers={}, content=json.dumps(registry).encode('utf-8'))
+        with patch.object(retriever, 'is_cache_outdated', return_value=False), \
+             patch.object(retriever._session, 'get', return_value=response) as mock_get:
+            self.assertEqual(retriever.get_registry(), registry)
+            mock_get.assert_called()
+
+        self.assertEqual(retriever._registry_cache, registry)
+        self.assertEqual(json.loads(gzip.decompress(retriever.registry_cache_path.read_bytes())), registry)
+
+    @regression_test
+    def test_cache_write_is_atomic(self):
+        """Test that a failed cache write leaves the previous cache file intact."""
+        retriever = RegistryRetriever(local_cache_dir=self.cache_dir, simulation_mode=False)
+        retriever.registry_cache_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self.assertTrue(retriever._write_local_cache_bytes(b'{"repositories":[]}'))
+        original = retriever.registry_cache_path.read_bytes()
+
+        with patch('hatch.registry_retriever.os.replace', side_effect=OSError("disk full")):
+            self.assertFalse(retriever._write_local_cache_bytes(b'{"repositories":[{"name":"repo"}]}'))
+
+        self.assertEqual(retriever.registry_cache_path.read_bytes(), original)
+        leftovers = [p.name for p in retriever.registry_cache_path.parent.iterdir() if ".tmp." in p.name]
+        self.assertEqual(leftovers, [])
+
+    @regression_test
+    def test_cache_write_recreates_removed_directory(self):
+        """Test that the cache is still written after its directory was removed."""
+        retriever = RegistryRetriever(local_cache_dir=self.cache_dir, simulation_mode=False)
+        shutil.rmtree(retriever.registry_cache_path.parent)
+
+        self.assertTrue(retriever._write_local_cache_bytes(b'{"repositories":[]}'))
+        self.assertTrue(retriever.registry_cache_path.exists())
+
 if __name__ == "__main__":
     unittest.main()